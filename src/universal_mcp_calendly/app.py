@@ -1,12 +1,1389 @@
+import asyncio
+import contextlib
+import copy
+import functools
+import importlib.util
+import inspect
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
+from urllib.parse import urlencode
+
+import httpx
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
+from universal_mcp.tools import Tool
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Calendly is a single host, so a modest pool of keep-alive connections is
+# enough; going much wider only invites TCP retransmissions under bursts.
+# Idle connections are kept for 85 seconds rather than httpx's default 5, so
+# an agent pausing between tool calls does not pay a new TLS handshake;
+# httpcore discards any the server has closed in the meantime.
+POOL_LIMITS = httpx.Limits(
+    max_connections=40, max_keepalive_connections=10, keepalive_expiry=85.0
+)
+REQUEST_TIMEOUT = httpx.Timeout(30.0, connect=3.05)
+CONNECT_RETRIES = 3
+# HTTP/2 lets concurrent requests share one connection instead of each
+# needing its own. httpx only supports it when the optional h2 package is
+# installed.
+HTTP2 = importlib.util.find_spec("h2") is not None
+# Rate limiting (429) and transient server errors are retried with
+# exponential backoff, honouring Retry-After when the API sends one. The
+# jitter keeps clients that failed together from retrying in lockstep.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.25
+RETRY_JITTER = 0.25
+MAX_RETRY_DELAY = 60.0
+# Requests are admitted through a token bucket so that bursts are smoothed
+# out on the client instead of being rejected by the API. The refill rate
+# halves on every 429 and creeps back up as requests succeed.
+RATE_LIMIT = 100 / 60
+RATE_LIMIT_BURST = 100
+FAN_OUT_CONCURRENCY = 16
+CACHE_SIZE = 1024
+# Users and event types rarely change; after this many seconds they are
+# revalidated with their ETag or Last-Modified date rather than trusted indefinitely.
+LOOKUP_REVALIDATE_AFTER = 300.0
+# Slow-moving collections are cached briefly; availability changes with
+# every booking, so it only gets a short window.
+LIST_CACHE_TTL = 300.0
+AVAILABILITY_CACHE_TTL = 30.0
+INVITEE_DELETION_CHUNK_SIZE = 100
+INVITEE_DELETION_CONCURRENCY = 4
+
+
+def _prune(**kwargs: Any) -> dict[str, Any]:
+    """
+    Drops arguments left as None, so that only the parameters the caller actually set are sent to the API.
+    """
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+# Resource identifiers end up as URL path segments. Calendly uses both
+# 16-character alphanumeric IDs and hyphenated UUIDs, so only the character
+# set is checked, not the length.
+_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _check_id(name: str, value: Any) -> None:
+    """
+    Raises ValueError unless `value` is a well-formed resource identifier, so that bad input fails locally instead of costing a round-trip.
+    """
+    if value is None:
+        raise ValueError(f"Missing required parameter '{name}'")
+    if not isinstance(value, str) or not _ID_PATTERN.fullmatch(value):
+        raise ValueError(f"Invalid value for parameter '{name}': {value!r}")
+
+
+def _check_positive(name: str, value: Any) -> None:
+    """
+    Raises ValueError unless `value` is an integer of at least 1, such as a chunk size or concurrency limit.
+    """
+    if not isinstance(value, int) or value < 1:
+        raise ValueError(f"Invalid value for parameter '{name}': {value!r}")
+
+
+def _require(*names: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Rejects calls that leave any of the named identifier parameters unset or malformed.
+
+    Parameter positions are resolved once when the method is decorated, so each call only indexes into `args` or looks up `kwargs`.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        parameters = list(inspect.signature(func).parameters)
+        positions = tuple((name, parameters.index(name)) for name in names)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for name, index in positions:
+                _check_id(name, args[index] if index < len(args) else kwargs.get(name))
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@functools.cache
+def _accepted_params(func: Callable[..., Any]) -> frozenset[str]:
+    """
+    The keyword arguments a method accepts, read from its signature once and then reused.
+    """
+    return frozenset(inspect.signature(func).parameters) - {"self"}
+
+
+def _parse(response: httpx.Response) -> Any:
+    """
+    Decodes a JSON response body, using orjson when it is installed. Empty bodies such as 204 No Content decode to None.
+    """
+    content = response.content
+    if not content:
+        return None
+    if orjson is not None:
+        return orjson.loads(content)
+    return response.json()
+
+
+def _conditional_headers(response: httpx.Response) -> dict[str, str] | None:
+    """
+    Returns the headers that revalidate `response` later: `If-None-Match` for an `ETag`, else `If-Modified-Since` for a `Last-Modified` date, else None.
+    """
+    etag = response.headers.get("ETag")
+    if etag:
+        return {"If-None-Match": etag}
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        return {"If-Modified-Since": last_modified}
+    return None
+
+
+def _retry_delay(
+    request: httpx.Request, response: httpx.Response, attempt: int
+) -> float | None:
+    """
+    Returns how many seconds to wait before retrying a request, or None if its response should be returned as is.
+
+    POSTs create resources, so they are only retried on 429, where the API guarantees the request was not processed.
+    """
+    if response.status_code not in RETRY_STATUSES:
+        return None
+    if (
+        request.method == "POST"
+        and response.status_code != httpx.codes.TOO_MANY_REQUESTS
+    ):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (
+                    parsedate_to_datetime(retry_after) - datetime.now(UTC)
+                ).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), MAX_RETRY_DELAY)
+    return min(RETRY_BACKOFF * 2**attempt, MAX_RETRY_DELAY) + random.uniform(
+        0, RETRY_JITTER
+    )
+
+
+class _TokenBucket:
+    """
+    A thread-safe token bucket with an adaptive refill rate.
+
+    `reserve` takes a token and returns how long the caller must wait before using it. Tokens may be borrowed against future refills, so concurrent callers queue up in arrival order instead of all waking at once.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_rate = self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def record(self, status_code: int) -> None:
+        """
+        Halves the refill rate after a 429 and recovers a tenth of the configured rate after any other response below 500.
+        """
+        with self._lock:
+            if status_code == httpx.codes.TOO_MANY_REQUESTS:
+                self.rate = max(self.rate / 2, self.max_rate / 16)
+            elif (
+                status_code < httpx.codes.INTERNAL_SERVER_ERROR
+                and self.rate < self.max_rate
+            ):
+                self.rate = min(self.rate + self.max_rate / 10, self.max_rate)
+
+
+class _RetryTransport(httpx.BaseTransport):
+    """
+    Wraps a transport to throttle requests through a token bucket and retry rate-limited and transiently failing ones. The final response is returned unchanged, so `raise_for_status` still fires once retries are exhausted.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        bucket: _TokenBucket,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        self._transport = transport
+        self._bucket = bucket
+        self._sleep = sleep
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        wait = self._bucket.reserve()
+        if wait:
+            self._sleep(wait)
+        response = self._transport.handle_request(request)
+        self._bucket.record(response.status_code)
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(MAX_RETRIES):
+            response = self._send(request)
+            delay = _retry_delay(request, response, attempt)
+            if delay is None:
+                return response
+            response.close()
+            self._sleep(delay)
+        return self._send(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """
+    Async counterpart of `_RetryTransport`.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, bucket: _TokenBucket
+    ) -> None:
+        self._transport = transport
+        self._bucket = bucket
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        wait = self._bucket.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        response = await self._transport.handle_async_request(request)
+        self._bucket.record(response.status_code)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(MAX_RETRIES):
+            response = await self._send(request)
+            delay = _retry_delay(request, response, attempt)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+        return await self._send(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_MISSING = object()
+# Batch-table TTL markers: the lookup bypasses the response cache, or uses
+# the instance's `event_cache_ttl` like `get_event` does.
+_UNCACHED = object()
+_EVENT_TTL = object()
+
+
+class _ResponseCache:
+    """
+    A thread-safe LRU cache of decoded GET responses keyed by URL, with an optional time-to-live per entry.
+
+    Values are deep-copied on the way in and on the way out, so callers that modify a returned payload never change what other callers see.
+
+    Entries that came with an `ETag` or `Last-Modified` header are kept after they expire, along with the conditional request headers built from it, so that they can be revalidated instead of downloaded again.
+    """
+
+    def __init__(
+        self, maxsize: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[
+            str, tuple[float | None, dict[str, str] | None, Any]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.revalidations = 0
+        self._inflight: dict[str, list] = {}
+
+    def get(self, key: str, record: bool = True) -> Any:
+        """
+        Returns the cached value for `key`, or `_MISSING` if it is absent or expired. With `record=False` the lookup is left out of the hit/miss counts.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += record
+                return _MISSING
+            expires_at, conditions, value = entry
+            if expires_at is not None and expires_at <= self._clock():
+                if conditions is None:
+                    del self._entries[key]
+                self.misses += record
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += record
+        return copy.deepcopy(value)
+
+    @contextlib.contextmanager
+    def single_flight(self, key: str) -> Iterator[None]:
+        """
+        Serialises fetches of the same key across threads, so that callers arriving while one is in flight can wait for it and then read its result from the cache.
+        """
+        with self._lock:
+            slot = self._inflight.get(key)
+            if slot is None:
+                slot = self._inflight[key] = [threading.Lock(), 0]
+            slot[1] += 1
+        try:
+            with slot[0]:
+                yield
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if not slot[1]:
+                    del self._inflight[key]
+
+    def validator(self, key: str) -> tuple[dict[str, str], Any] | None:
+        """
+        Returns the `(conditional_headers, value)` pair stored for `key`, fresh or not, or None if there is nothing to revalidate with.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] is None:
+                return None
+            conditions, value = entry[1], entry[2]
+        return conditions, copy.deepcopy(value)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        conditions: dict[str, str] | None = None,
+    ) -> None:
+        expires_at = None if ttl is None else self._clock() + ttl
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, conditions, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def record_revalidation(self) -> None:
+        with self._lock:
+            self.revalidations += 1
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_if(self, predicate: Callable[[str], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
 
 class CalendlyApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
+    # APIApplication keeps a __dict__ for its own attributes; the state added
+    # here lives in slots so it does not grow it further.
+    __slots__ = (
+        "base_url",
+        "_async_client",
+        "_async_loop",
+        "_inflight",
+        "_bucket",
+        "_me",
+        "_me_lock",
+        "_cache",
+        "event_cache_ttl",
+    )
+
+    # Endpoint paths, relative to base_url.
+    _EP_SCHEDULED_EVENT_INVITEES = "/scheduled_events/%s/invitees"
+    _EP_SCHEDULED_EVENT = "/scheduled_events/%s"
+    _EP_SCHEDULED_EVENT_INVITEE = "/scheduled_events/%s/invitees/%s"
+    _EP_SCHEDULED_EVENTS = "/scheduled_events"
+    _EP_EVENT_TYPE = "/event_types/%s"
+    _EP_EVENT_TYPES = "/event_types"
+    _EP_USER = "/users/%s"
+    _EP_USERS_ME = "/users/me"
+    _EP_ORGANIZATION_INVITATIONS = "/organizations/%s/invitations"
+    _EP_ORGANIZATION_INVITATION = "/organizations/%s/invitations/%s"
+    _EP_ORGANIZATION_MEMBERSHIP = "/organization_memberships/%s"
+    _EP_ORGANIZATION_MEMBERSHIPS = "/organization_memberships"
+    _EP_WEBHOOK_SUBSCRIPTION = "/webhook_subscriptions/%s"
+    _EP_WEBHOOK_SUBSCRIPTIONS = "/webhook_subscriptions"
+    _EP_SCHEDULING_LINKS = "/scheduling_links"
+    _EP_DATA_COMPLIANCE_DELETION_INVITEES = "/data_compliance/deletion/invitees"
+    _EP_DATA_COMPLIANCE_DELETION_EVENTS = "/data_compliance/deletion/events"
+    _EP_INVITEE_NO_SHOW = "/invitee_no_shows/%s"
+    _EP_INVITEE_NO_SHOWS = "/invitee_no_shows"
+    _EP_GROUP = "/groups/%s"
+    _EP_GROUPS = "/groups"
+    _EP_GROUP_RELATIONSHIP = "/group_relationships/%s"
+    _EP_GROUP_RELATIONSHIPS = "/group_relationships"
+    _EP_ROUTING_FORM = "/routing_forms/%s"
+    _EP_ROUTING_FORMS = "/routing_forms"
+    _EP_ROUTING_FORM_SUBMISSION = "/routing_form_submissions/%s"
+    _EP_ROUTING_FORM_SUBMISSIONS = "/routing_form_submissions"
+    _EP_EVENT_TYPE_AVAILABLE_TIMES = "/event_type_available_times"
+    _EP_ACTIVITY_LOG_ENTRIES = "/activity_log_entries"
+    _EP_SHARES = "/shares"
+    _EP_USER_BUSY_TIMES = "/user_busy_times"
+    _EP_USER_AVAILABILITY_SCHEDULE = "/user_availability_schedules/%s"
+    _EP_USER_AVAILABILITY_SCHEDULES = "/user_availability_schedules"
+    _EP_EVENT_TYPE_MEMBERSHIPS = "/event_type_memberships"
+    _EP_ONE_OFF_EVENT_TYPES = "/one_off_event_types"
+    _EP_SAMPLE_WEBHOOK_DATA = "/sample_webhook_data"
+
+    # Methods exposed as MCP tools, in registration order.
+    _TOOL_NAMES = (
+        "list_event_invitees",
+        "get_event",
+        "get_event_invitee",
+        "list_events",
+        "get_event_type",
+        "list_user_sevent_types",
+        "get_user",
+        "get_current_user",
+        "list_organization_invitations",
+        "invite_user_to_organization",
+        "get_organization_invitation",
+        "revoke_user_sorganization_invitation",
+        "get_organization_membership",
+        "remove_user_from_organization",
+        "list_organization_memberships",
+        "get_webhook_subscription",
+        "delete_webhook_subscription",
+        "list_webhook_subscriptions",
+        "create_webhook_subscription",
+        "create_single_use_scheduling_link",
+        "delete_invitee_data",
+        "delete_scheduled_event_data",
+        "get_invitee_no_show",
+        "delete_invitee_no_show",
+        "create_invitee_no_show",
+        "get_group",
+        "list_groups",
+        "get_group_relationship",
+        "list_group_relationships",
+        "get_routing_form",
+        "list_routing_forms",
+        "get_routing_form_submission",
+        "list_routing_form_submissions",
+        "list_event_type_available_times",
+        "list_activity_log_entries",
+        "create_share",
+        "list_user_busy_times",
+        "get_user_availability_schedule",
+        "list_user_availability_schedules",
+        "list_event_type_hosts",
+        "create_one_off_event_type",
+        "get_sample_webhook_data",
+    )
+
+    # Single-resource getters that `aget_many` can fan out, by method name,
+    # with the cache TTL the getter itself uses, so both paths share entries.
+    _BATCH_GETTERS = {
+        "get_event": (_EP_SCHEDULED_EVENT, _EVENT_TTL),
+        "get_event_invitee": (_EP_SCHEDULED_EVENT_INVITEE, _EVENT_TTL),
+        "get_event_type": (_EP_EVENT_TYPE, LOOKUP_REVALIDATE_AFTER),
+        "get_user": (_EP_USER, LOOKUP_REVALIDATE_AFTER),
+        "get_organization_invitation": (_EP_ORGANIZATION_INVITATION, _UNCACHED),
+        "get_organization_membership": (
+            _EP_ORGANIZATION_MEMBERSHIP,
+            LOOKUP_REVALIDATE_AFTER,
+        ),
+        "get_webhook_subscription": (_EP_WEBHOOK_SUBSCRIPTION, LOOKUP_REVALIDATE_AFTER),
+        "get_invitee_no_show": (_EP_INVITEE_NO_SHOW, _UNCACHED),
+        "get_group": (_EP_GROUP, LOOKUP_REVALIDATE_AFTER),
+        "get_group_relationship": (_EP_GROUP_RELATIONSHIP, LOOKUP_REVALIDATE_AFTER),
+        "get_routing_form": (_EP_ROUTING_FORM, LOOKUP_REVALIDATE_AFTER),
+        "get_routing_form_submission": (
+            _EP_ROUTING_FORM_SUBMISSION,
+            LOOKUP_REVALIDATE_AFTER,
+        ),
+        "get_user_availability_schedule": (
+            _EP_USER_AVAILABILITY_SCHEDULE,
+            LOOKUP_REVALIDATE_AFTER,
+        ),
+    }
+
+    # Single-resource deletes that `adelete_many` can fan out, by method name,
+    # with the cached collections each deletion makes stale.
+    _BATCH_DELETERS = {
+        "delete_webhook_subscription": (_EP_WEBHOOK_SUBSCRIPTION, ()),
+        "remove_user_from_organization": (
+            _EP_ORGANIZATION_MEMBERSHIP,
+            (_EP_GROUP_RELATIONSHIPS,),
+        ),
+        "revoke_user_sorganization_invitation": (
+            _EP_ORGANIZATION_INVITATION,
+            (_EP_GROUP_RELATIONSHIPS,),
+        ),
+    }
+
+    # Paginated list endpoints that `iter_pages` can walk, by method name,
+    # with the name of the argument filling their path if they take one.
+    _PAGINATED = {
+        "list_event_invitees": (_EP_SCHEDULED_EVENT_INVITEES, "uuid"),
+        "list_events": (_EP_SCHEDULED_EVENTS, None),
+        "list_user_sevent_types": (_EP_EVENT_TYPES, None),
+        "list_organization_invitations": (_EP_ORGANIZATION_INVITATIONS, "uuid"),
+        "list_organization_memberships": (_EP_ORGANIZATION_MEMBERSHIPS, None),
+        "list_webhook_subscriptions": (_EP_WEBHOOK_SUBSCRIPTIONS, None),
+        "list_groups": (_EP_GROUPS, None),
+        "list_group_relationships": (_EP_GROUP_RELATIONSHIPS, None),
+        "list_routing_forms": (_EP_ROUTING_FORMS, None),
+        "list_routing_form_submissions": (_EP_ROUTING_FORM_SUBMISSIONS, None),
+        "list_activity_log_entries": (_EP_ACTIVITY_LOG_ENTRIES, None),
+        "list_event_type_hosts": (_EP_EVENT_TYPE_MEMBERSHIPS, None),
+    }
+
+    def __init__(
+        self,
+        integration: Integration = None,
+        cache_size: int = CACHE_SIZE,
+        event_cache_ttl: float | None = None,
+        rate_limit: float = RATE_LIMIT,
+        rate_limit_burst: int = RATE_LIMIT_BURST,
+        **kwargs,
+    ) -> None:
+        """
+        Args:
+            integration: The integration providing Calendly credentials
+            cache_size: Maximum number of GET responses kept in the in-memory cache
+            event_cache_ttl: Seconds to cache scheduled events and invitees for. These change more often than users or event types, so by default every lookup goes to the API, revalidating with the stored `ETag` or `Last-Modified` date so that unchanged ones are not downloaded again.
+            rate_limit: Sustained requests per second allowed through the client-side rate limiter, shared by the sync and async clients
+            rate_limit_burst: Number of requests that may be sent back to back before the rate limit applies
+        """
         super().__init__(name='calendly', integration=integration, **kwargs)
         self.base_url = "https://api.calendly.com"
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._bucket = _TokenBucket(rate_limit, rate_limit_burst)
+        self._me: dict[str, Any] | None = None
+        self._me_lock = threading.Lock()
+        self._cache = _ResponseCache(cache_size)
+        self.event_cache_ttl = event_cache_ttl
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Returns the shared HTTP client, creating it on first use.
+
+        All requests reuse the same pool of keep-alive connections to the Calendly API, so the TCP and TLS handshakes are paid once instead of on every call. httpx advertises every content encoding it can decode (gzip and deflate always, br and zstd when their packages are installed), so list responses travel compressed.
+
+        Returns:
+            httpx.Client: The pooled HTTP client
+        """
+        if not self._client:
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=REQUEST_TIMEOUT,
+                transport=_RetryTransport(
+                    httpx.HTTPTransport(
+                        http2=HTTP2, limits=POOL_LIMITS, retries=CONNECT_RETRIES
+                    ),
+                    self._bucket,
+                ),
+            )
+        return self._client
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP client, if one was created. A new client is created on the next request.
+        """
+        if self._client:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "CalendlyApp":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _post(
+        self,
+        url: str,
+        data: Any,
+        params: dict[str, Any] | None = None,
+        content_type: str = "application/json",
+        files: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """
+        Makes a POST request through the pooled client.
+
+        JSON bodies rely on the authorization headers attached to the client when it was created, rather than resolving the integration's credentials again on every call, and are encoded with orjson when it is installed. Other content types fall back to the base implementation.
+        """
+        if content_type != "application/json" or files:
+            return super()._post(
+                url, data, params=params, content_type=content_type, files=files
+            )
+        if orjson is not None:
+            response = self.client.post(
+                url,
+                content=orjson.dumps(data),
+                params=params,
+                headers={"Content-Type": "application/json"},
+            )
+        else:
+            response = self.client.post(url, json=data, params=params)
+        response.raise_for_status()
+        return response
+
+    def _delete(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """
+        Makes a DELETE request through the pooled client, using its configured timeouts.
+        """
+        response = self.client.delete(url, params=params)
+        response.raise_for_status()
+        return response
+
+    def _get_json(
+        self, url: str | httpx.URL, params: dict[str, Any] | None = None
+    ) -> Any:
+        return _parse(self._get(url, params=params))
+
+    def _post_json(
+        self, url: str, data: Any, params: dict[str, Any] | None = None
+    ) -> Any:
+        return _parse(self._post(url, data=data, params=params))
+
+    def _delete_json(self, url: str, params: dict[str, Any] | None = None) -> Any:
+        return _parse(self._delete(url, params=params))
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Returns the shared async HTTP client used by the batch helpers, creating it on first use.
+
+        The client's connections belong to the event loop it was first used on, so when called from a different loop (e.g. a second `asyncio.run`) the old client and any in-flight fetches are abandoned and a new client is created.
+
+        Returns:
+            httpx.AsyncClient: The pooled async HTTP client
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            if self._async_loop is not None:
+                self._async_client = None
+                self._inflight.clear()
+            self._async_loop = loop
+        if not self._async_client:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=REQUEST_TIMEOUT,
+                transport=_AsyncRetryTransport(
+                    httpx.AsyncHTTPTransport(
+                        http2=HTTP2, limits=POOL_LIMITS, retries=CONNECT_RETRIES
+                    ),
+                    self._bucket,
+                ),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """
+        Closes the async HTTP client, if one was created.
+        """
+        if self._async_client:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+    async def _aget(
+        self, url: str | httpx.URL, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        response = await self.async_client.get(url, params=params)
+        response.raise_for_status()
+        return response
+
+    async def _adelete(self, url: str) -> Any:
+        response = await self.async_client.delete(url)
+        response.raise_for_status()
+        self._cache.pop(url)
+        return _parse(response)
+
+    async def _aget_json(self, url: str, ttl: Any = _UNCACHED) -> Any:
+        """
+        Decoded GET that coalesces concurrent requests for the same URL: later callers await the fetch already in flight instead of issuing their own.
+
+        Unless `ttl` is `_UNCACHED`, the URL is looked up in and stored to the response cache exactly as `_cached_get` would, including conditional revalidation.
+        """
+        cached = ttl is not _UNCACHED
+        if cached:
+            body = self._cache.get(url)
+            if body is not _MISSING:
+                return body
+        task = self._inflight.get(url)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            return copy.deepcopy(await asyncio.shield(task))
+
+        async def fetch() -> Any:
+            if not cached:
+                return _parse(await self._aget(url))
+            validator = self._cache.validator(url)
+            response = await self.async_client.get(
+                url, headers=validator[0] if validator else None
+            )
+            return self._cache_response(url, response, validator, ttl)
+
+        task = self._inflight[url] = asyncio.ensure_future(fetch())
+        task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(task)
+
+    def _batch_urls(
+        self,
+        table: dict[str, tuple[Any, ...]],
+        name: str,
+        ids: Iterable[str | tuple[str, ...]],
+    ) -> list[str]:
+        """
+        Validates a batch call against one of the `_BATCH_*` tables and builds the URL for every identifier.
+        """
+        try:
+            template = table[name][0]
+        except KeyError:
+            raise ValueError(f"'{name}' cannot be run in batch") from None
+        arity = template.count("%s")
+        urls = []
+        for id_ in ids:
+            parts = id_ if isinstance(id_, tuple) else (id_,)
+            if len(parts) != arity:
+                raise ValueError(
+                    f"'{name}' takes {arity} identifier(s) per item, got {id_!r}"
+                )
+            for part in parts:
+                _check_id("ids", part)
+            urls.append(self.base_url + template % parts)
+        return urls
+
+    async def _agather(
+        self,
+        request: Callable[[str], Coroutine[Any, Any, Any]],
+        urls: Iterable[str],
+        concurrency: int,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Runs `request` for every URL concurrently, at most `concurrency` at a time, and returns the results in input order.
+        """
+        _check_positive("concurrency", concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(url: str) -> Any:
+            async with semaphore:
+                return await request(url)
+
+        return await asyncio.gather(
+            *(bounded(url) for url in urls), return_exceptions=return_exceptions
+        )
+
+    def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Runs a batch coroutine to completion for synchronous callers.
+
+        The async client is bound to the event loop it was first used on, so it is closed again before the loop started here goes away.
+        """
+        async def runner() -> Any:
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return asyncio.run(runner())
+
+    async def aget_many(
+        self,
+        getter: str,
+        ids: Iterable[str | tuple[str, ...]],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Calls a single-resource getter for many identifiers concurrently.
+
+        Args:
+            getter (string): Name of the getter to fan out, e.g. `"get_group"`. Must be one of `_BATCH_GETTERS`.
+            ids (list): The getter's path arguments: a UUID, or a tuple of UUIDs for getters that take several, such as `get_event_invitee`
+            concurrency (integer): Maximum number of requests in flight at once
+            return_exceptions (boolean): Return failed lookups as exception objects in the result list instead of raising the first one
+
+        Returns:
+            list[Any]: The payloads, in the same order as `ids`
+        """
+        urls = self._batch_urls(self._BATCH_GETTERS, getter, ids)
+        ttl = self._getter_ttl(getter)
+        return await self._agather(
+            functools.partial(self._aget_json, ttl=ttl),
+            urls,
+            concurrency,
+            return_exceptions,
+        )
+
+    async def aget_events(
+        self, uuids: Iterable[str], concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieves several scheduled events concurrently.
+
+        Args:
+            uuids (list[string]): UUIDs of the scheduled events to fetch
+            concurrency (integer): Maximum number of requests in flight at once
+
+        Returns:
+            list[dict[str, Any]]: The event payloads, in the same order as `uuids`
+        """
+        return await self.aget_many("get_event", uuids, concurrency)
+
+    async def aget_event_invitees(
+        self, pairs: Iterable[tuple[str, str]], concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieves several scheduled event invitees concurrently.
+
+        Args:
+            pairs (list[tuple[string, string]]): `(event_uuid, invitee_uuid)` pairs to fetch
+            concurrency (integer): Maximum number of requests in flight at once
+
+        Returns:
+            list[dict[str, Any]]: The invitee payloads, in the same order as `pairs`
+        """
+        return await self.aget_many(
+            "get_event_invitee", (tuple(pair) for pair in pairs), concurrency
+        )
+
+    async def aget_users(
+        self, uuids: Iterable[str], concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieves several users concurrently.
+
+        Args:
+            uuids (list[string]): UUIDs of the users to fetch
+            concurrency (integer): Maximum number of requests in flight at once
+
+        Returns:
+            list[dict[str, Any]]: The user payloads, in the same order as `uuids`
+        """
+        return await self.aget_many("get_user", uuids, concurrency)
+
+    def get_many(
+        self,
+        getter: str,
+        ids: Iterable[str | tuple[str, ...]],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Synchronous wrapper around `aget_many`. Must not be called from a running event loop.
+        """
+        return self._run(self.aget_many(getter, ids, concurrency, return_exceptions))
+
+    def get_events_many(
+        self, uuids: Iterable[str], concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> list[dict[str, Any]]:
+        """
+        Synchronous wrapper around `aget_events`. Must not be called from a running event loop.
+        """
+        return self._run(self.aget_events(uuids, concurrency))
+
+    def get_event_invitees_many(
+        self, pairs: Iterable[tuple[str, str]], concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> list[dict[str, Any]]:
+        """
+        Synchronous wrapper around `aget_event_invitees`. Must not be called from a running event loop.
+        """
+        return self._run(self.aget_event_invitees(pairs, concurrency))
+
+    def get_users_many(
+        self, uuids: Iterable[str], concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> list[dict[str, Any]]:
+        """
+        Synchronous wrapper around `aget_users`. Must not be called from a running event loop.
+        """
+        return self._run(self.aget_users(uuids, concurrency))
+
+    async def adelete_many(
+        self,
+        deleter: str,
+        ids: Iterable[str | tuple[str, ...]],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Calls a single-resource delete for many identifiers concurrently, dropping each deleted resource from the response cache.
+
+        Args:
+            deleter (string): Name of the delete method to fan out, e.g. `"delete_webhook_subscription"`. Must be one of `_BATCH_DELETERS`.
+            ids (list): The method's path arguments: a UUID, or a tuple of UUIDs for methods that take several, such as `revoke_user_sorganization_invitation`
+            concurrency (integer): Maximum number of requests in flight at once
+            return_exceptions (boolean): Return failed deletions as exception objects in the result list instead of raising the first one
+
+        Returns:
+            list[Any]: The response bodies (usually None), in the same order as `ids`
+        """
+        urls = self._batch_urls(self._BATCH_DELETERS, deleter, ids)
+        try:
+            return await self._agather(
+                self._adelete, urls, concurrency, return_exceptions
+            )
+        finally:
+            for path in self._BATCH_DELETERS[deleter][1]:
+                self._invalidate_prefix(path)
+
+    async def adelete_webhook_subscriptions(
+        self, uuids: Iterable[str], concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> list[Any]:
+        """
+        Deletes several webhook subscriptions concurrently.
+
+        Args:
+            uuids (list[string]): UUIDs of the webhook subscriptions to delete
+            concurrency (integer): Maximum number of requests in flight at once
+
+        Returns:
+            list[Any]: The response bodies, in the same order as `uuids`
+        """
+        return await self.adelete_many(
+            "delete_webhook_subscription", uuids, concurrency
+        )
+
+    def delete_many(
+        self,
+        deleter: str,
+        ids: Iterable[str | tuple[str, ...]],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Synchronous wrapper around `adelete_many`. Must not be called from a running event loop.
+        """
+        return self._run(
+            self.adelete_many(deleter, ids, concurrency, return_exceptions)
+        )
+
+    def delete_webhook_subscriptions_many(
+        self, uuids: Iterable[str], concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> list[Any]:
+        """
+        Synchronous wrapper around `adelete_webhook_subscriptions`. Must not be called from a running event loop.
+        """
+        return self._run(self.adelete_webhook_subscriptions(uuids, concurrency))
+
+    def _batch_calls(
+        self, calls: Iterable[tuple[str, dict[str, Any]]]
+    ) -> list[Callable[[], Any]]:
+        tools = self.tool_map
+        bound = []
+        for name, kwargs in calls:
+            if name not in tools:
+                raise ValueError(f"'{name}' is not a Calendly tool")
+            bound.append(functools.partial(tools[name], **kwargs))
+        return bound
+
+    def run_batch(
+        self,
+        calls: Iterable[tuple[str, dict[str, Any]]],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Runs several tool calls concurrently on a thread pool, sharing the pooled client, its cache and its rate limiter.
+
+        Args:
+            calls (list[tuple[string, dict]]): `(tool_name, kwargs)` pairs, e.g. `("list_user_busy_times", {"user": ..., "start_time": ..., "end_time": ...})`
+            concurrency (integer): Maximum number of calls running at once
+            return_exceptions (boolean): Return failed calls as exception objects in the result list instead of raising the first one
+
+        Returns:
+            list[Any]: The results, in the same order as `calls`
+        """
+        _check_positive("concurrency", concurrency)
+        bound = self._batch_calls(calls)
+
+        def call(fn: Callable[[], Any]) -> Any:
+            try:
+                return fn()
+            except Exception as exc:
+                if return_exceptions:
+                    return exc
+                raise
+
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(bound)) or 1
+        ) as executor:
+            return list(executor.map(call, bound))
+
+    async def arun_batch(
+        self,
+        calls: Iterable[tuple[str, dict[str, Any]]],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Async counterpart of `run_batch`: each call runs in a worker thread, at most `concurrency` at a time, without blocking the event loop.
+        """
+        _check_positive("concurrency", concurrency)
+        bound = self._batch_calls(calls)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(fn: Callable[[], Any]) -> Any:
+            async with semaphore:
+                return await asyncio.to_thread(fn)
+
+        return await asyncio.gather(
+            *(call(fn) for fn in bound), return_exceptions=return_exceptions
+        )
+
+    def _cached_get(
+        self, url: str, params: dict[str, Any] | None = None, ttl: float | None = None
+    ) -> Any:
+        """
+        GETs a URL through the response cache, keyed by the URL and its sorted query parameters, only going to the network on a miss.
+
+        When an expired entry carries an `ETag`, the request is sent with `If-None-Match`, or with `If-Modified-Since` when the API only sent `Last-Modified`; a 304 then renews the cached body without transferring or decoding it again.
+        Concurrent misses for the same key from several threads result in a single request; the others wait for it and share its result.
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        body = self._cache.get(key)
+        if body is not _MISSING:
+            return body
+        with self._cache.single_flight(key):
+            body = self._cache.get(key, record=False)
+            if body is not _MISSING:
+                return body
+            validator = self._cache.validator(key)
+            if validator is None:
+                response = self._get(url, params=params)
+            else:
+                response = self.client.get(url, params=params, headers=validator[0])
+            return self._cache_response(key, response, validator, ttl)
+
+    def _getter_ttl(self, getter: str) -> Any:
+        ttl = self._BATCH_GETTERS[getter][1]
+        return self.event_cache_ttl or 0.0 if ttl is _EVENT_TTL else ttl
+
+    def _lookup(self, getter: str, *ids: str) -> Any:
+        """
+        Fetches a single resource for one of the `_BATCH_GETTERS`, so that the getter and `aget_many` share one URL template, one cache TTL and therefore one cache entry.
+        """
+        url = self.base_url + self._BATCH_GETTERS[getter][0] % ids
+        ttl = self._getter_ttl(getter)
+        if ttl is _UNCACHED:
+            return self._get_json(url)
+        return self._cached_get(url, ttl=ttl)
+
+    def _cache_response(
+        self,
+        key: str,
+        response: httpx.Response,
+        validator: tuple[dict[str, str], Any] | None,
+        ttl: float | None,
+    ) -> Any:
+        """
+        Turns the response to a possibly conditional GET into its body, renewing or replacing the cache entry for `key`.
+        """
+        if response.status_code == httpx.codes.NOT_MODIFIED and validator is not None:
+            conditions, body = validator
+            self._cache.record_revalidation()
+        else:
+            response.raise_for_status()
+            conditions, body = _conditional_headers(response), _parse(response)
+        if conditions is not None or ttl is None or ttl > 0:
+            self._cache.set(key, body, ttl, conditions)
+        return body
+
+    def invalidate_cache(self, uuid: str | None = None) -> None:
+        """
+        Drops cached GET responses so that the next lookup goes back to the API.
+
+        Args:
+            uuid (string): Only drop responses for resources identified by this UUID. Drops everything when omitted.
+        """
+        if uuid is None:
+            self._cache.clear()
+        else:
+            self._cache.discard_if(lambda key: uuid in key.partition("?")[0].split("/"))
+
+    def _invalidate_prefix(self, path: str) -> None:
+        prefix = self.base_url + path
+        self._cache.discard_if(lambda key: key.startswith(prefix))
+
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Reports how the response cache is performing.
+
+        Returns:
+            dict[str, int]: Counts of `hits`, `misses` and conditional-request `revalidations` since the app was created, plus the current `size` and `maxsize` of the cache
+        """
+        return self._cache.stats()
+
+    def _iter_pages(self, url: str, params: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """
+        Yields every item of a paginated list endpoint, following `next_page_token` until the collection is exhausted.
+
+        The URL is parsed and the filters pruned once for the whole walk; only `page_token` changes between requests. The next page is requested in the background as soon as the current one arrives, so its round-trip overlaps with the caller consuming the current page.
+        """
+        url = httpx.URL(url)
+
+        def fetch(page_token: str | None) -> dict[str, Any]:
+            return self._get_json(
+                url, {**params, "page_token": page_token} if page_token else params
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = fetch(params.get("page_token"))
+            while True:
+                token = (page.get("pagination") or {}).get("next_page_token")
+                next_page = executor.submit(fetch, token) if token else None
+                yield from page.get("collection") or []
+                if next_page is None:
+                    return
+                page = next_page.result()
+
+    def _page_request(
+        self, list_method: str, filters: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Resolves a paginated list method's name and arguments into its URL and query parameters.
+        """
+        try:
+            template, path_arg = self._PAGINATED[list_method]
+        except KeyError:
+            raise ValueError(
+                f"'{list_method}' is not a paginated list endpoint"
+            ) from None
+        unknown = filters.keys() - _accepted_params(getattr(type(self), list_method))
+        if unknown:
+            raise ValueError(
+                f"'{list_method}' does not accept {', '.join(sorted(unknown))}"
+            )
+        params = _prune(**filters)
+        if path_arg is None:
+            return self.base_url + template, params
+        path_value = params.pop(path_arg, None)
+        _check_id(path_arg, path_value)
+        return self.base_url + template % path_value, params
+
+    def iter_pages(self, list_method: str, **filters: Any) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over every item of a paginated list endpoint, across all pages, prefetching each next page in the background.
+
+        Args:
+            list_method (string): Name of the list method to walk, e.g. `"list_activity_log_entries"`
+            **filters: Any of the keyword arguments accepted by that method, including its path argument
+
+        Returns:
+            Iterator[dict[str, Any]]: The items of every page's `collection`
+        """
+        return self._iter_pages(*self._page_request(list_method, filters))
+
+    def iter_events(self, **filters: Any) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over all scheduled events matching the filters, across every page.
+
+        Args:
+            **filters: Any of the keyword arguments accepted by `list_events`
+
+        Returns:
+            Iterator[dict[str, Any]]: The scheduled events
+        """
+        return self.iter_pages("list_events", **filters)
+
+    def iter_event_invitees(self, uuid, **filters: Any) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over all invitees of a scheduled event, across every page.
+
+        Args:
+            uuid (string): uuid
+            **filters: Any of the other keyword arguments accepted by `list_event_invitees`
+
+        Returns:
+            Iterator[dict[str, Any]]: The invitees
+        """
+        return self.iter_pages("list_event_invitees", uuid=uuid, **filters)
+
+    async def _aiter_pages(
+        self, url: str, params: dict[str, Any]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Async counterpart of `_iter_pages`: the next page is fetched as a task while the current page's items are being consumed.
+        """
+        url = httpx.URL(url)
+
+        async def fetch(page_token: str | None) -> dict[str, Any]:
+            response = await self._aget(
+                url,
+                params={**params, "page_token": page_token} if page_token else params,
+            )
+            return _parse(response)
+
+        page = await fetch(params.get("page_token"))
+        while True:
+            token = (page.get("pagination") or {}).get("next_page_token")
+            next_page = asyncio.create_task(fetch(token)) if token else None
+            try:
+                for item in page.get("collection") or []:
+                    yield item
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            if next_page is None:
+                return
+            page = await next_page
+
+    def aiter_pages(
+        self, list_method: str, **filters: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Asynchronously iterates over every item of a paginated list endpoint, across all pages, prefetching each next page as a task.
+
+        Args:
+            list_method (string): Name of the list method to walk, e.g. `"list_activity_log_entries"`
+            **filters: Any of the keyword arguments accepted by that method, including its path argument
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The items of every page's `collection`
+        """
+        return self._aiter_pages(*self._page_request(list_method, filters))
+
+    def aiter_events(self, **filters: Any) -> AsyncIterator[dict[str, Any]]:
+        """
+        Asynchronously iterates over all scheduled events matching the filters, across every page.
+
+        Args:
+            **filters: Any of the keyword arguments accepted by `list_events`
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The scheduled events
+        """
+        return self.aiter_pages("list_events", **filters)
+
+    def aiter_event_invitees(
+        self, uuid, **filters: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Asynchronously iterates over all invitees of a scheduled event, across every page.
+
+        Args:
+            uuid (string): uuid
+            **filters: Any of the other keyword arguments accepted by `list_event_invitees`
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: The invitees
+        """
+        return self.aiter_pages("list_event_invitees", uuid=uuid, **filters)
+
+    async def alist_all_many(
+        self,
+        list_method: str,
+        ids: Iterable[str],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        **filters: Any,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Collects every item of a per-resource paginated list endpoint for many resources concurrently. Each collection's pages are still walked in order, since every page token comes from the page before it.
+
+        Args:
+            list_method (string): Name of a list method that takes a path argument, e.g. `"list_event_invitees"`
+            ids (list[string]): Values of that method's path argument, one per collection to walk
+            concurrency (integer): Maximum number of collections walked at once
+            **filters: Any of the other keyword arguments accepted by that method, applied to every collection
+
+        Returns:
+            list[list[dict[str, Any]]]: The items of each collection, in the same order as `ids`
+        """
+        path_arg = self._PAGINATED.get(list_method, (None, None))[1]
+        if path_arg is None:
+            raise ValueError(
+                f"'{list_method}' is not a per-resource paginated list endpoint"
+            )
+        _check_positive("concurrency", concurrency)
+        walks = [
+            self._page_request(list_method, {**filters, path_arg: id_}) for id_ in ids
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def collect(url: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+            async with semaphore:
+                return [item async for item in self._aiter_pages(url, params)]
+
+        return await asyncio.gather(*(collect(url, params) for url, params in walks))
+
+    async def alist_event_invitees_many(
+        self,
+        uuids: Iterable[str],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        **filters: Any,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Collects all invitees of several scheduled events concurrently.
+
+        Args:
+            uuids (list[string]): UUIDs of the scheduled events
+            concurrency (integer): Maximum number of events walked at once
+            **filters: Any of the other keyword arguments accepted by `list_event_invitees`
+
+        Returns:
+            list[list[dict[str, Any]]]: Each event's invitees, in the same order as `uuids`
+        """
+        return await self.alist_all_many(
+            "list_event_invitees", uuids, concurrency, **filters
+        )
+
+    def list_event_invitees_many(
+        self,
+        uuids: Iterable[str],
+        concurrency: int = FAN_OUT_CONCURRENCY,
+        **filters: Any,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Synchronous wrapper around `alist_event_invitees_many`. Must not be called from a running event loop.
+        """
+        return self._run(self.alist_event_invitees_many(uuids, concurrency, **filters))
 
+    @_require("uuid")
     def list_event_invitees(self, uuid, status=None, sort=None, email=None, page_token=None, count=None) -> dict[str, Any]:
         """
         Retrieves a paginated list of invitees for a specific scheduled event with optional filtering by status, email, and sorting parameters.
@@ -25,14 +1402,13 @@ class CalendlyApp(APIApplication):
         Tags:
             scheduled_events, {uuid}, invitees, important
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/scheduled_events/{uuid}/invitees"
-        query_params = {k: v for k, v in [('status', status), ('sort', sort), ('email', email), ('page_token', page_token), ('count', count)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_SCHEDULED_EVENT_INVITEES % uuid
+        query_params = _prune(
+            status=status, sort=sort, email=email, page_token=page_token, count=count
+        )
+        return self._get_json(url, query_params)
 
+    @_require("uuid")
     def get_event(self, uuid) -> dict[str, Any]:
         """
         Retrieves details about a scheduled event identified by the provided UUID using the GET method.
@@ -46,14 +1422,9 @@ class CalendlyApp(APIApplication):
         Tags:
             scheduled_events, important
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/scheduled_events/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_event", uuid)
 
+    @_require("event_uuid", "invitee_uuid")
     def get_event_invitee(self, event_uuid, invitee_uuid) -> dict[str, Any]:
         """
         Retrieves detailed information about a specific invitee for a scheduled event using their unique identifiers.
@@ -68,15 +1439,7 @@ class CalendlyApp(APIApplication):
         Tags:
             scheduled_events, {event_uuid}, invitees1, {invitee_uuid}
         """
-        if event_uuid is None:
-            raise ValueError("Missing required parameter 'event_uuid'")
-        if invitee_uuid is None:
-            raise ValueError("Missing required parameter 'invitee_uuid'")
-        url = f"{self.base_url}/scheduled_events/{event_uuid}/invitees/{invitee_uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_event_invitee", event_uuid, invitee_uuid)
 
     def list_events(self, user=None, organization=None, invitee_email=None, status=None, sort=None, min_start_time=None, max_start_time=None, page_token=None, count=None, group=None) -> dict[str, Any]:
         """
@@ -102,12 +1465,22 @@ class CalendlyApp(APIApplication):
         Tags:
             scheduled_events, important
         """
-        url = f"{self.base_url}/scheduled_events"
-        query_params = {k: v for k, v in [('user', user), ('organization', organization), ('invitee_email', invitee_email), ('status', status), ('sort', sort), ('min_start_time', min_start_time), ('max_start_time', max_start_time), ('page_token', page_token), ('count', count), ('group', group)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
-
+        url = self.base_url + self._EP_SCHEDULED_EVENTS
+        query_params = _prune(
+            user=user,
+            organization=organization,
+            invitee_email=invitee_email,
+            status=status,
+            sort=sort,
+            min_start_time=min_start_time,
+            max_start_time=max_start_time,
+            page_token=page_token,
+            count=count,
+            group=group,
+        )
+        return self._get_json(url, query_params)
+
+    @_require("uuid")
     def get_event_type(self, uuid) -> dict[str, Any]:
         """
         Retrieves the details of a specific event type identified by its UUID using the path "/event_types/{uuid}" and the GET method.
@@ -121,13 +1494,7 @@ class CalendlyApp(APIApplication):
         Tags:
             event_types, {uuid}1
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/event_types/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_event_type", uuid)
 
     def list_user_sevent_types(self, active=None, organization=None, user=None, user_availability_schedule=None, sort=None, admin_managed=None, page_token=None, count=None) -> dict[str, Any]:
         """
@@ -149,12 +1516,20 @@ class CalendlyApp(APIApplication):
         Tags:
             event_types
         """
-        url = f"{self.base_url}/event_types"
-        query_params = {k: v for k, v in [('active', active), ('organization', organization), ('user', user), ('user_availability_schedule', user_availability_schedule), ('sort', sort), ('admin_managed', admin_managed), ('page_token', page_token), ('count', count)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
-
+        url = self.base_url + self._EP_EVENT_TYPES
+        query_params = _prune(
+            active=active,
+            organization=organization,
+            user=user,
+            user_availability_schedule=user_availability_schedule,
+            sort=sort,
+            admin_managed=admin_managed,
+            page_token=page_token,
+            count=count,
+        )
+        return self._get_json(url, query_params)
+
+    @_require("uuid")
     def get_user(self, uuid) -> dict[str, Any]:
         """
         Retrieves a user's details by their unique identifier (UUID) and returns the user data.
@@ -168,17 +1543,11 @@ class CalendlyApp(APIApplication):
         Tags:
             users, {uuid}12
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/users/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_user", uuid)
 
     def get_current_user(self) -> dict[str, Any]:
         """
-        Retrieves information about the current user using the API.
+        Retrieves information about the current user using the API. The result is cached for the lifetime of the app, since the authenticated user does not change.
 
         Returns:
             dict[str, Any]: OK
@@ -186,12 +1555,24 @@ class CalendlyApp(APIApplication):
         Tags:
             users, me, important
         """
-        url = f"{self.base_url}/users/me"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        if self._me is None:
+            with self._me_lock:
+                if self._me is None:
+                    url = self.base_url + self._EP_USERS_ME
+                    self._me = self._get_json(url)
+        return copy.deepcopy(self._me)
+
+    def refresh_current_user(self) -> dict[str, Any]:
+        """
+        Drops the cached current user and fetches it again from the API.
 
+        Returns:
+            dict[str, Any]: OK
+        """
+        self._me = None
+        return self.get_current_user()
+
+    @_require("uuid")
     def list_organization_invitations(self, uuid, count=None, page_token=None, sort=None, email=None, status=None) -> dict[str, Any]:
         """
         Retrieves a list of invitations for an organization identified by its UUID, allowing filtering by count, page token, sort order, email, and invitation status.
@@ -210,14 +1591,13 @@ class CalendlyApp(APIApplication):
         Tags:
             organizations, {uuid}123, invitations
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/organizations/{uuid}/invitations"
-        query_params = {k: v for k, v in [('count', count), ('page_token', page_token), ('sort', sort), ('email', email), ('status', status)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_ORGANIZATION_INVITATIONS % uuid
+        query_params = _prune(
+            count=count, page_token=page_token, sort=sort, email=email, status=status
+        )
+        return self._get_json(url, query_params)
 
+    @_require("uuid")
     def invite_user_to_organization(self, uuid, email=None) -> dict[str, Any]:
         """
         Creates an invitation for a user to join an organization, identified by the provided UUID, and sends it to the specified recipient.
@@ -238,18 +1618,15 @@ class CalendlyApp(APIApplication):
         Tags:
             organizations, {uuid}123, invitations
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        request_body = {
-            'email': email,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/organizations/{uuid}/invitations"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        request_body = _prune(
+            email=email,
+        )
+        url = self.base_url + self._EP_ORGANIZATION_INVITATIONS % uuid
+        body = self._post_json(url, request_body)
+        self._invalidate_prefix(self._EP_GROUP_RELATIONSHIPS)
+        return body
 
+    @_require("org_uuid", "uuid")
     def get_organization_invitation(self, org_uuid, uuid) -> dict[str, Any]:
         """
         Retrieves information about an organization invitation identified by its UUID, returning details about the invitation using the specified organization UUID and invitation UUID.
@@ -264,16 +1641,9 @@ class CalendlyApp(APIApplication):
         Tags:
             organizations, {org_uuid}, invitations1, {uuid}1234
         """
-        if org_uuid is None:
-            raise ValueError("Missing required parameter 'org_uuid'")
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/organizations/{org_uuid}/invitations/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_organization_invitation", org_uuid, uuid)
 
+    @_require("org_uuid", "uuid")
     def revoke_user_sorganization_invitation(self, org_uuid, uuid) -> Any:
         """
         Deletes one or more organization invitations and returns success or error codes indicating invalid tokens, missing invitations, or authorization issues.
@@ -288,16 +1658,12 @@ class CalendlyApp(APIApplication):
         Tags:
             organizations, {org_uuid}, invitations1, {uuid}1234
         """
-        if org_uuid is None:
-            raise ValueError("Missing required parameter 'org_uuid'")
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/organizations/{org_uuid}/invitations/{uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_ORGANIZATION_INVITATION % (org_uuid, uuid)
+        body = self._delete_json(url)
+        self._invalidate_prefix(self._EP_GROUP_RELATIONSHIPS)
+        return body
 
+    @_require("uuid")
     def get_organization_membership(self, uuid) -> dict[str, Any]:
         """
         Retrieves details of a specific organization membership using its unique identifier.
@@ -311,14 +1677,9 @@ class CalendlyApp(APIApplication):
         Tags:
             organization_memberships, {uuid}12345
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/organization_memberships/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_organization_membership", uuid)
 
+    @_require("uuid")
     def remove_user_from_organization(self, uuid) -> Any:
         """
         Removes a user from an organization using the specified UUID and returns a success status if the operation is completed without errors.
@@ -332,13 +1693,11 @@ class CalendlyApp(APIApplication):
         Tags:
             organization_memberships, {uuid}12345
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/organization_memberships/{uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_ORGANIZATION_MEMBERSHIP % uuid
+        body = self._delete_json(url)
+        self._cache.pop(url)
+        self._invalidate_prefix(self._EP_GROUP_RELATIONSHIPS)
+        return body
 
     def list_organization_memberships(self, page_token=None, count=None, email=None, organization=None, user=None) -> dict[str, Any]:
         """
@@ -357,12 +1716,17 @@ class CalendlyApp(APIApplication):
         Tags:
             organization_memberships
         """
-        url = f"{self.base_url}/organization_memberships"
-        query_params = {k: v for k, v in [('page_token', page_token), ('count', count), ('email', email), ('organization', organization), ('user', user)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
-
+        url = self.base_url + self._EP_ORGANIZATION_MEMBERSHIPS
+        query_params = _prune(
+            page_token=page_token,
+            count=count,
+            email=email,
+            organization=organization,
+            user=user,
+        )
+        return self._get_json(url, query_params)
+
+    @_require("webhook_uuid")
     def get_webhook_subscription(self, webhook_uuid) -> dict[str, Any]:
         """
         Retrieves the details of a webhook subscription identified by the specified `webhook_uuid`, returning relevant subscription information in response.
@@ -376,14 +1740,9 @@ class CalendlyApp(APIApplication):
         Tags:
             webhook_subscriptions, {webhook_uuid}
         """
-        if webhook_uuid is None:
-            raise ValueError("Missing required parameter 'webhook_uuid'")
-        url = f"{self.base_url}/webhook_subscriptions/{webhook_uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_webhook_subscription", webhook_uuid)
 
+    @_require("webhook_uuid")
     def delete_webhook_subscription(self, webhook_uuid) -> Any:
         """
         Deletes a webhook subscription identified by its unique UUID and returns a success response upon completion.
@@ -397,13 +1756,10 @@ class CalendlyApp(APIApplication):
         Tags:
             webhook_subscriptions, {webhook_uuid}
         """
-        if webhook_uuid is None:
-            raise ValueError("Missing required parameter 'webhook_uuid'")
-        url = f"{self.base_url}/webhook_subscriptions/{webhook_uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_WEBHOOK_SUBSCRIPTION % webhook_uuid
+        body = self._delete_json(url)
+        self._cache.pop(url)
+        return body
 
     def list_webhook_subscriptions(self, organization=None, user=None, page_token=None, count=None, sort=None, scope=None) -> dict[str, Any]:
         """
@@ -425,11 +1781,16 @@ class CalendlyApp(APIApplication):
         Tags:
             webhook_subscriptions
         """
-        url = f"{self.base_url}/webhook_subscriptions"
-        query_params = {k: v for k, v in [('organization', organization), ('user', user), ('page_token', page_token), ('count', count), ('sort', sort), ('scope', scope)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_WEBHOOK_SUBSCRIPTIONS
+        query_params = _prune(
+            organization=organization,
+            user=user,
+            page_token=page_token,
+            count=count,
+            sort=sort,
+            scope=scope,
+        )
+        return self._get_json(url, query_params)
 
     def create_webhook_subscription(self, events=None, group=None, organization=None, scope=None, signing_key=None, url=None, user=None) -> dict[str, Any]:
         """
@@ -465,21 +1826,17 @@ class CalendlyApp(APIApplication):
         Tags:
             webhook_subscriptions
         """
-        request_body = {
-            'events': events,
-            'group': group,
-            'organization': organization,
-            'scope': scope,
-            'signing_key': signing_key,
-            'url': url,
-            'user': user,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/webhook_subscriptions"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        request_body = _prune(
+            events=events,
+            group=group,
+            organization=organization,
+            scope=scope,
+            signing_key=signing_key,
+            url=url,
+            user=user,
+        )
+        url = self.base_url + self._EP_WEBHOOK_SUBSCRIPTIONS
+        return self._post_json(url, request_body)
 
     def create_single_use_scheduling_link(self, max_event_count=None, owner=None, owner_type=None) -> dict[str, Any]:
         """
@@ -504,19 +1861,20 @@ class CalendlyApp(APIApplication):
         Tags:
             scheduling_links
         """
-        request_body = {
-            'max_event_count': max_event_count,
-            'owner': owner,
-            'owner_type': owner_type,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/scheduling_links"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
-
-    def delete_invitee_data(self, emails=None) -> dict[str, Any]:
+        request_body = _prune(
+            max_event_count=max_event_count,
+            owner=owner,
+            owner_type=owner_type,
+        )
+        url = self.base_url + self._EP_SCHEDULING_LINKS
+        return self._post_json(url, request_body)
+
+    def delete_invitee_data(
+        self,
+        emails=None,
+        chunk_size=INVITEE_DELETION_CHUNK_SIZE,
+        concurrency=INVITEE_DELETION_CONCURRENCY,
+    ) -> dict[str, Any]:
         """
         Initiates data deletion requests for invitees in compliance with data privacy regulations.
 
@@ -531,22 +1889,40 @@ class CalendlyApp(APIApplication):
                   ]
                 }
                 ```
+            chunk_size (integer): Maximum number of emails sent in one request; longer lists are split into chunks that are submitted concurrently Example: '100'.
+            concurrency (integer): Maximum number of chunk requests in flight at once Example: '4'.
 
         Returns:
             dict[str, Any]: Accepted
 
+        Raises:
+            ValueError: If `chunk_size` or `concurrency` is less than 1
+            httpx.HTTPStatusError: If a chunk is rejected. Chunks already accepted are not rolled back, so their deletions still go ahead.
+
         Tags:
             data_compliance, deletion, invitees12
         """
-        request_body = {
-            'emails': emails,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/data_compliance/deletion/invitees"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        _check_positive("chunk_size", chunk_size)
+        _check_positive("concurrency", concurrency)
+        url = self.base_url + self._EP_DATA_COMPLIANCE_DELETION_INVITEES
+        if not emails or len(emails) <= chunk_size:
+            request_body = _prune(
+                emails=emails,
+            )
+            body = self._post_json(url, request_body)
+            self._invalidate_prefix(self._EP_SCHEDULED_EVENTS)
+            return body
+
+        def post_chunk(chunk: list[str]) -> Any:
+            return self._post_json(url, {'emails': chunk})
+
+        chunks = [emails[i:i + chunk_size] for i in range(0, len(emails), chunk_size)]
+        result: dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for body in executor.map(post_chunk, chunks):
+                result.update(body or {})
+        self._invalidate_prefix(self._EP_SCHEDULED_EVENTS)
+        return result
 
     def delete_scheduled_event_data(self, end_time=None, start_time=None) -> dict[str, Any]:
         """
@@ -569,17 +1945,16 @@ class CalendlyApp(APIApplication):
         Tags:
             data_compliance, deletion, events
         """
-        request_body = {
-            'end_time': end_time,
-            'start_time': start_time,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/data_compliance/deletion/events"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        request_body = _prune(
+            end_time=end_time,
+            start_time=start_time,
+        )
+        url = self.base_url + self._EP_DATA_COMPLIANCE_DELETION_EVENTS
+        body = self._post_json(url, request_body)
+        self._invalidate_prefix(self._EP_SCHEDULED_EVENTS)
+        return body
 
+    @_require("uuid")
     def get_invitee_no_show(self, uuid) -> dict[str, Any]:
         """
         Retrieves information about an invitee who did not show up, identified by a specific UUID, using the GET method via the API endpoint "/invitee_no_shows/{uuid}".
@@ -593,14 +1968,9 @@ class CalendlyApp(APIApplication):
         Tags:
             invitee_no_shows, {uuid}123456
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/invitee_no_shows/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_invitee_no_show", uuid)
 
+    @_require("uuid")
     def delete_invitee_no_show(self, uuid) -> Any:
         """
         Removes an invitee's "no-show" status using their unique identifier (uuid) and returns an empty response upon successful deletion.
@@ -614,13 +1984,10 @@ class CalendlyApp(APIApplication):
         Tags:
             invitee_no_shows, {uuid}123456
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/invitee_no_shows/{uuid}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_INVITEE_NO_SHOW % uuid
+        body = self._delete_json(url)
+        self._invalidate_prefix(self._EP_SCHEDULED_EVENTS)
+        return body
 
     def create_invitee_no_show(self, invitee=None) -> dict[str, Any]:
         """
@@ -641,16 +2008,16 @@ class CalendlyApp(APIApplication):
         Tags:
             invitee_no_shows
         """
-        request_body = {
-            'invitee': invitee,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/invitee_no_shows"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        request_body = _prune(
+            invitee=invitee,
+        )
+        url = self.base_url + self._EP_INVITEE_NO_SHOWS
+        body = self._post_json(url, request_body)
+        if invitee:
+            self.invalidate_cache(invitee.rstrip("/").rpartition("/")[2])
+        return body
 
+    @_require("uuid")
     def get_group(self, uuid) -> dict[str, Any]:
         """
         Retrieves information about a group specified by its UUID from the API.
@@ -664,13 +2031,7 @@ class CalendlyApp(APIApplication):
         Tags:
             groups, {uuid}1234567
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/groups/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_group", uuid)
 
     def list_groups(self, organization=None, page_token=None, count=None) -> dict[str, Any]:
         """
@@ -687,12 +2048,13 @@ class CalendlyApp(APIApplication):
         Tags:
             groups
         """
-        url = f"{self.base_url}/groups"
-        query_params = {k: v for k, v in [('organization', organization), ('page_token', page_token), ('count', count)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_GROUPS
+        query_params = _prune(
+            organization=organization, page_token=page_token, count=count
+        )
+        return self._cached_get(url, query_params, ttl=LIST_CACHE_TTL)
 
+    @_require("uuid")
     def get_group_relationship(self, uuid) -> dict[str, Any]:
         """
         Retrieves information about group relationships identified by the specified UUID using the GET method.
@@ -706,13 +2068,7 @@ class CalendlyApp(APIApplication):
         Tags:
             group_relationships, {uuid}12345678
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/group_relationships/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_group_relationship", uuid)
 
     def list_group_relationships(self, count=None, page_token=None, organization=None, owner=None, group=None) -> dict[str, Any]:
         """
@@ -732,12 +2088,17 @@ class CalendlyApp(APIApplication):
         Tags:
             group_relationships
         """
-        url = f"{self.base_url}/group_relationships"
-        query_params = {k: v for k, v in [('count', count), ('page_token', page_token), ('organization', organization), ('owner', owner), ('group', group)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
-
+        url = self.base_url + self._EP_GROUP_RELATIONSHIPS
+        query_params = _prune(
+            count=count,
+            page_token=page_token,
+            organization=organization,
+            owner=owner,
+            group=group,
+        )
+        return self._cached_get(url, query_params, ttl=LIST_CACHE_TTL)
+
+    @_require("uuid")
     def get_routing_form(self, uuid) -> dict[str, Any]:
         """
         Retrieves a routing form by its unique identifier (UUID) using the GET method via the "/routing_forms/{uuid}" path.
@@ -751,13 +2112,7 @@ class CalendlyApp(APIApplication):
         Tags:
             routing_forms, {uuid}123456789
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/routing_forms/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_routing_form", uuid)
 
     def list_routing_forms(self, organization=None, count=None, page_token=None, sort=None) -> dict[str, Any]:
         """
@@ -775,12 +2130,13 @@ class CalendlyApp(APIApplication):
         Tags:
             routing_forms
         """
-        url = f"{self.base_url}/routing_forms"
-        query_params = {k: v for k, v in [('organization', organization), ('count', count), ('page_token', page_token), ('sort', sort)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_ROUTING_FORMS
+        query_params = _prune(
+            organization=organization, count=count, page_token=page_token, sort=sort
+        )
+        return self._cached_get(url, query_params, ttl=LIST_CACHE_TTL)
 
+    @_require("uuid")
     def get_routing_form_submission(self, uuid) -> dict[str, Any]:
         """
         Retrieves a specific routing form submission by its unique identifier (UUID) using the Calendly API.
@@ -794,13 +2150,7 @@ class CalendlyApp(APIApplication):
         Tags:
             routing_form_submissions, {uuid}12345678910
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/routing_form_submissions/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_routing_form_submission", uuid)
 
     def list_routing_form_submissions(self, form=None, count=None, page_token=None, sort=None) -> dict[str, Any]:
         """
@@ -818,11 +2168,9 @@ class CalendlyApp(APIApplication):
         Tags:
             routing_form_submissions
         """
-        url = f"{self.base_url}/routing_form_submissions"
-        query_params = {k: v for k, v in [('form', form), ('count', count), ('page_token', page_token), ('sort', sort)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_ROUTING_FORM_SUBMISSIONS
+        query_params = _prune(form=form, count=count, page_token=page_token, sort=sort)
+        return self._get_json(url, query_params)
 
     def list_event_type_available_times(self, event_type=None, start_time=None, end_time=None) -> dict[str, Any]:
         """
@@ -839,11 +2187,11 @@ class CalendlyApp(APIApplication):
         Tags:
             event_type_available_times
         """
-        url = f"{self.base_url}/event_type_available_times"
-        query_params = {k: v for k, v in [('event_type', event_type), ('start_time', start_time), ('end_time', end_time)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_EVENT_TYPE_AVAILABLE_TIMES
+        query_params = _prune(
+            event_type=event_type, start_time=start_time, end_time=end_time
+        )
+        return self._cached_get(url, query_params, ttl=AVAILABILITY_CACHE_TTL)
 
     def list_activity_log_entries(self, organization=None, search_term=None, actor=None, sort=None, min_occurred_at=None, max_occurred_at=None, page_token=None, count=None, namespace=None, action=None) -> dict[str, Any]:
         """
@@ -867,11 +2215,20 @@ class CalendlyApp(APIApplication):
         Tags:
             activity_log_entries
         """
-        url = f"{self.base_url}/activity_log_entries"
-        query_params = {k: v for k, v in [('organization', organization), ('search_term', search_term), ('actor', actor), ('sort', sort), ('min_occurred_at', min_occurred_at), ('max_occurred_at', max_occurred_at), ('page_token', page_token), ('count', count), ('namespace', namespace), ('action', action)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_ACTIVITY_LOG_ENTRIES
+        query_params = _prune(
+            organization=organization,
+            search_term=search_term,
+            actor=actor,
+            sort=sort,
+            min_occurred_at=min_occurred_at,
+            max_occurred_at=max_occurred_at,
+            page_token=page_token,
+            count=count,
+            namespace=namespace,
+            action=action,
+        )
+        return self._get_json(url, query_params)
 
     def create_share(self, availability_rule=None, duration=None, end_date=None, event_type=None, hide_location=None, location_configurations=None, max_booking_time=None, name=None, period_type=None, start_date=None) -> dict[str, Any]:
         """
@@ -959,24 +2316,22 @@ class CalendlyApp(APIApplication):
         Tags:
             shares
         """
-        request_body = {
-            'availability_rule': availability_rule,
-            'duration': duration,
-            'end_date': end_date,
-            'event_type': event_type,
-            'hide_location': hide_location,
-            'location_configurations': location_configurations,
-            'max_booking_time': max_booking_time,
-            'name': name,
-            'period_type': period_type,
-            'start_date': start_date,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/shares"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        request_body = _prune(
+            availability_rule=availability_rule,
+            duration=duration,
+            end_date=end_date,
+            event_type=event_type,
+            hide_location=hide_location,
+            location_configurations=location_configurations,
+            max_booking_time=max_booking_time,
+            name=name,
+            period_type=period_type,
+            start_date=start_date,
+        )
+        url = self.base_url + self._EP_SHARES
+        body = self._post_json(url, request_body)
+        self._invalidate_prefix(self._EP_EVENT_TYPE_AVAILABLE_TIMES)
+        return body
 
     def list_user_busy_times(self, user=None, start_time=None, end_time=None) -> dict[str, Any]:
         """
@@ -993,12 +2348,11 @@ class CalendlyApp(APIApplication):
         Tags:
             user_busy_times
         """
-        url = f"{self.base_url}/user_busy_times"
-        query_params = {k: v for k, v in [('user', user), ('start_time', start_time), ('end_time', end_time)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_USER_BUSY_TIMES
+        query_params = _prune(user=user, start_time=start_time, end_time=end_time)
+        return self._cached_get(url, query_params, ttl=AVAILABILITY_CACHE_TTL)
 
+    @_require("uuid")
     def get_user_availability_schedule(self, uuid) -> dict[str, Any]:
         """
         Retrieves the availability schedule of a user based on the provided UUID using the GET method.
@@ -1012,13 +2366,7 @@ class CalendlyApp(APIApplication):
         Tags:
             user_availability_schedules, {uuid}1234567891011
         """
-        if uuid is None:
-            raise ValueError("Missing required parameter 'uuid'")
-        url = f"{self.base_url}/user_availability_schedules/{uuid}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        return self._lookup("get_user_availability_schedule", uuid)
 
     def list_user_availability_schedules(self, user=None) -> dict[str, Any]:
         """
@@ -1033,11 +2381,9 @@ class CalendlyApp(APIApplication):
         Tags:
             user_availability_schedules
         """
-        url = f"{self.base_url}/user_availability_schedules"
-        query_params = {k: v for k, v in [('user', user)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_USER_AVAILABILITY_SCHEDULES
+        query_params = _prune(user=user)
+        return self._cached_get(url, query_params, ttl=LIST_CACHE_TTL)
 
     def list_event_type_hosts(self, event_type=None, count=None, page_token=None) -> dict[str, Any]:
         """
@@ -1054,11 +2400,9 @@ class CalendlyApp(APIApplication):
         Tags:
             event_type_memberships
         """
-        url = f"{self.base_url}/event_type_memberships"
-        query_params = {k: v for k, v in [('event_type', event_type), ('count', count), ('page_token', page_token)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_EVENT_TYPE_MEMBERSHIPS
+        query_params = _prune(event_type=event_type, count=count, page_token=page_token)
+        return self._cached_get(url, query_params, ttl=LIST_CACHE_TTL)
 
     def create_one_off_event_type(self, co_hosts=None, date_setting=None, duration=None, host=None, location=None, name=None, timezone=None) -> dict[str, Any]:
         """
@@ -1098,21 +2442,20 @@ class CalendlyApp(APIApplication):
         Tags:
             one_off_event_types
         """
-        request_body = {
-            'co_hosts': co_hosts,
-            'date_setting': date_setting,
-            'duration': duration,
-            'host': host,
-            'location': location,
-            'name': name,
-            'timezone': timezone,
-        }
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        url = f"{self.base_url}/one_off_event_types"
-        query_params = {}
-        response = self._post(url, data=request_body, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        request_body = _prune(
+            co_hosts=co_hosts,
+            date_setting=date_setting,
+            duration=duration,
+            host=host,
+            location=location,
+            name=name,
+            timezone=timezone,
+        )
+        url = self.base_url + self._EP_ONE_OFF_EVENT_TYPES
+        body = self._post_json(url, request_body)
+        self._invalidate_prefix(self._EP_EVENT_TYPE_AVAILABLE_TIMES)
+        self._invalidate_prefix(self._EP_EVENT_TYPE_MEMBERSHIPS)
+        return body
 
     def get_sample_webhook_data(self, event=None, organization=None, user=None, scope=None) -> dict[str, Any]:
         """
@@ -1130,54 +2473,31 @@ class CalendlyApp(APIApplication):
         Tags:
             sample_webhook_data
         """
-        url = f"{self.base_url}/sample_webhook_data"
-        query_params = {k: v for k, v in [('event', event), ('organization', organization), ('user', user), ('scope', scope)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        return response.json()
+        url = self.base_url + self._EP_SAMPLE_WEBHOOK_DATA
+        query_params = _prune(
+            event=event, organization=organization, user=user, scope=scope
+        )
+        return self._cached_get(url, query_params, ttl=LIST_CACHE_TTL)
+
+    @functools.cached_property
+    def tool_map(self) -> dict[str, Callable[..., Any]]:
+        """
+        Maps each tool's name to its bound method, for O(1) dispatch by name.
+        """
+        return {name: getattr(self, name) for name in self._TOOL_NAMES}
+
+    @functools.cached_property
+    def tool_schemas(self) -> dict[str, Tool]:
+        """
+        Maps each tool's name to its parsed `Tool` (description, argument docs and JSON schema), built once per instance.
+        These can be handed to `ToolManager.register_tools` so the docstrings and signatures are not re-parsed on every registration.
+        """
+        return {
+            name: Tool.from_function(method) for name, method in self.tool_map.items()
+        }
+
+    def get_tool_schema(self, name: str) -> Tool:
+        return self.tool_schemas[name]
 
     def list_tools(self):
-        return [
-            self.list_event_invitees,
-            self.get_event,
-            self.get_event_invitee,
-            self.list_events,
-            self.get_event_type,
-            self.list_user_sevent_types,
-            self.get_user,
-            self.get_current_user,
-            self.list_organization_invitations,
-            self.invite_user_to_organization,
-            self.get_organization_invitation,
-            self.revoke_user_sorganization_invitation,
-            self.get_organization_membership,
-            self.remove_user_from_organization,
-            self.list_organization_memberships,
-            self.get_webhook_subscription,
-            self.delete_webhook_subscription,
-            self.list_webhook_subscriptions,
-            self.create_webhook_subscription,
-            self.create_single_use_scheduling_link,
-            self.delete_invitee_data,
-            self.delete_scheduled_event_data,
-            self.get_invitee_no_show,
-            self.delete_invitee_no_show,
-            self.create_invitee_no_show,
-            self.get_group,
-            self.list_groups,
-            self.get_group_relationship,
-            self.list_group_relationships,
-            self.get_routing_form,
-            self.list_routing_forms,
-            self.get_routing_form_submission,
-            self.list_routing_form_submissions,
-            self.list_event_type_available_times,
-            self.list_activity_log_entries,
-            self.create_share,
-            self.list_user_busy_times,
-            self.get_user_availability_schedule,
-            self.list_user_availability_schedules,
-            self.list_event_type_hosts,
-            self.create_one_off_event_type,
-            self.get_sample_webhook_data
-        ]
+        return list(self.tool_map.values())
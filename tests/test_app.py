@@ -1,10 +1,18 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 from universal_mcp.utils.testing import (
     check_application_instance,
 )
 
+from universal_mcp_calendly import app as app_module
 from universal_mcp_calendly.app import CalendlyApp
 
 @pytest.fixture
@@ -15,3 +23,731 @@ def app_instance():
 
 def test_application(app_instance):
     check_application_instance(app_instance, app_name="calendly")
+
+def test_client_is_pooled_and_reused(app_instance):
+    client = app_instance.client
+    assert client is app_instance.client
+    assert str(client.base_url) == "https://api.calendly.com"
+    assert client.headers["Authorization"] == "Bearer dummy_access_token"
+
+def test_close_releases_the_pool(app_instance):
+    with app_instance as app:
+        client = app.client
+    assert client.is_closed
+    assert app_instance.client is not client
+
+
+def test_get_events_many_fans_out_in_order(app_instance):
+    def handler(request):
+        return httpx.Response(
+            httpx.codes.OK, json={"resource": {"uri": request.url.path}}
+        )
+
+    app_instance._async_client = httpx.AsyncClient(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    events = app_instance.get_events_many(["a", "b", "c"], concurrency=2)
+    assert [e["resource"]["uri"] for e in events] == [
+        "/scheduled_events/a",
+        "/scheduled_events/b",
+        "/scheduled_events/c",
+    ]
+    assert app_instance._async_client is None
+
+def test_concurrent_identical_gets_share_one_request(app_instance):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            httpx.codes.OK, json={"resource": {"uri": request.url.path}}
+        )
+
+    app_instance._async_client = httpx.AsyncClient(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    events = app_instance.get_events_many(["a", "a", "b", "a"])
+    assert [e["resource"]["uri"] for e in events] == [
+        "/scheduled_events/a",
+        "/scheduled_events/a",
+        "/scheduled_events/b",
+        "/scheduled_events/a",
+    ]
+    assert sorted(calls) == ["/scheduled_events/a", "/scheduled_events/b"]
+    assert not app_instance._inflight
+
+def test_batch_lookups_share_the_response_cache(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(
+            httpx.codes.OK, json={"resource": {"uri": request.url.path}}
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance._async_client = httpx.AsyncClient(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.get_user("u1")
+    assert app_instance.get_users_many(["u1"]) == [{"resource": {"uri": "/users/u1"}}]
+    assert calls == ["/users/u1"]
+
+    app_instance._async_client = httpx.AsyncClient(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.get_many("get_group", ["g1"])
+    assert app_instance.get_group("g1") == {"resource": {"uri": "/groups/g1"}}
+    assert calls == ["/users/u1", "/groups/g1"]
+
+@pytest.fixture
+def local_api():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = json.dumps({"resource": {"uri": self.path}}).encode()
+            self.send_response(httpx.codes.OK)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def test_batch_helpers_work_across_event_loops(app_instance, local_api):
+    app_instance.base_url = local_api
+    assert asyncio.run(app_instance.aget_events(["a"])) == [
+        {"resource": {"uri": "/scheduled_events/a"}}
+    ]
+    assert asyncio.run(app_instance.aget_events(["b"])) == [
+        {"resource": {"uri": "/scheduled_events/b"}}
+    ]
+    assert app_instance.get_events_many(["c"]) == [
+        {"resource": {"uri": "/scheduled_events/c"}}
+    ]
+
+
+def test_iter_events_follows_page_tokens(app_instance):
+    pages = {
+        None: {
+            "collection": [{"id": 1}, {"id": 2}],
+            "pagination": {"next_page_token": "p2"},
+        },
+        "p2": {"collection": [{"id": 3}], "pagination": {"next_page_token": None}},
+    }
+
+    def handler(request):
+        assert request.url.params["status"] == "active"
+        return httpx.Response(
+            httpx.codes.OK, json=pages[request.url.params.get("page_token")]
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    assert [e["id"] for e in app_instance.iter_events(status="active")] == [1, 2, 3]
+
+def test_unset_params_are_not_sent(app_instance):
+    def handler(request):
+        assert dict(request.url.params) == {
+            "user": "https://api.calendly.com/users/me",
+            "count": "20",
+        }
+        return httpx.Response(httpx.codes.OK, json={"collection": []})
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.list_events(user="https://api.calendly.com/users/me", count="20")
+
+def test_current_user_is_cached(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(
+            httpx.codes.OK,
+            json={"resource": {"uri": "https://api.calendly.com/users/me"}},
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    me = app_instance.get_current_user()
+    me["resource"]["uri"] = "mutated"
+    assert app_instance.get_current_user() == {
+        "resource": {"uri": "https://api.calendly.com/users/me"}
+    }
+    assert calls == ["/users/me"]
+    app_instance.refresh_current_user()
+    assert calls == ["/users/me", "/users/me"]
+
+def test_uuid_lookups_are_cached_until_invalidated(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(
+            httpx.codes.OK, json={"resource": {"uri": str(request.url)}}
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.get_user("u1")
+    app_instance.get_user("u1")
+    app_instance.get_event("e1")
+    app_instance.get_event("e1")
+    assert calls == ["/users/u1", "/scheduled_events/e1", "/scheduled_events/e1"]
+    app_instance.invalidate_cache("u1")
+    app_instance.get_user("u1")
+    assert calls[-1] == "/users/u1"
+
+def test_cached_payloads_are_isolated_from_callers(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(httpx.codes.OK, json={"resource": {"name": "Ada"}})
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.get_user("u1")["resource"]["name"] = "mutated"
+    hit = app_instance.get_user("u1")
+    assert hit == {"resource": {"name": "Ada"}}
+    hit["resource"]["name"] = "mutated"
+    assert app_instance.get_user("u1") == {"resource": {"name": "Ada"}}
+    assert len(calls) == 1
+
+def test_cache_stats_and_mutation_invalidation(app_instance):
+    def handler(request):
+        if request.method == "POST":
+            return httpx.Response(httpx.codes.CREATED, json={"resource": {}})
+        return httpx.Response(
+            httpx.codes.OK, json={"resource": {"uri": request.url.path}}
+        )
+
+    app = CalendlyApp(integration=app_instance.integration, event_cache_ttl=60)
+    app._client = httpx.Client(
+        base_url=app.base_url, transport=httpx.MockTransport(handler)
+    )
+    app.get_event_invitee("e1", "i1")
+    app.get_event_invitee("e1", "i1")
+    assert app.cache_stats() == {
+        "hits": 1,
+        "misses": 1,
+        "revalidations": 0,
+        "size": 1,
+        "maxsize": app_module.CACHE_SIZE,
+    }
+    app.create_invitee_no_show(
+        invitee="https://api.calendly.com/scheduled_events/e1/invitees/i1"
+    )
+    assert app.cache_stats()["size"] == 0
+
+def test_concurrent_cached_lookups_share_one_request(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        time.sleep(0.05)
+        return httpx.Response(
+            httpx.codes.OK, json={"resource": {"uri": request.url.path}}
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        users = list(executor.map(app_instance.get_user, ["u1"] * 4))
+    assert users == [{"resource": {"uri": "/users/u1"}}] * 4
+    assert calls == ["/users/u1"]
+    assert not app_instance._cache._inflight
+
+def test_creating_a_share_drops_cached_availability(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(
+            httpx.codes.CREATED if request.method == "POST" else httpx.codes.OK,
+            json={"collection": []},
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.list_event_type_available_times(event_type="t1")
+    app_instance.list_event_type_available_times(event_type="t1")
+    app_instance.create_share(event_type="t1", duration=45)
+    app_instance.list_event_type_available_times(event_type="t1")
+    assert calls == ["GET", "POST", "GET"]
+
+def test_organization_changes_drop_cached_group_relationships(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if request.method == "GET":
+            return httpx.Response(
+                httpx.codes.OK, json={"collection": [], "calls": len(calls)}
+            )
+        return httpx.Response(
+            httpx.codes.CREATED if request.method == "POST" else httpx.codes.NO_CONTENT,
+            json={},
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance._async_client = httpx.AsyncClient(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    mutations = [
+        lambda: app_instance.invite_user_to_organization("o1", email="a@example.com"),
+        lambda: app_instance.revoke_user_sorganization_invitation("o1", "i1"),
+        lambda: app_instance.remove_user_from_organization("m1"),
+        lambda: app_instance.delete_many("remove_user_from_organization", ["m2"]),
+    ]
+    for mutate in mutations:
+        before = app_instance.list_group_relationships(organization="o1")
+        assert app_instance.list_group_relationships(organization="o1") == before
+        mutate()
+        assert app_instance.list_group_relationships(organization="o1") != before
+
+def test_no_content_responses_decode_to_none(app_instance):
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url,
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(httpx.codes.NO_CONTENT)
+        ),
+    )
+    assert app_instance.delete_webhook_subscription("w1") is None
+
+def test_delete_invitee_data_splits_long_email_lists(app_instance):
+    batches = []
+
+    def handler(request):
+        batches.append(json.loads(request.content)["emails"])
+        return httpx.Response(httpx.codes.ACCEPTED, json={})
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    emails = [f"user{i}@example.com" for i in range(5)]
+    assert app_instance.delete_invitee_data(emails, chunk_size=2, concurrency=2) == {}
+    assert sorted(email for batch in batches for email in batch) == sorted(emails)
+    assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+
+
+@pytest.mark.parametrize(
+    "option", [{"chunk_size": 0}, {"chunk_size": -1}, {"concurrency": 0}]
+)
+def test_delete_invitee_data_rejects_invalid_chunking(app_instance, option):
+    def handler(request):
+        raise AssertionError("no request expected")
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    with pytest.raises(ValueError, match=next(iter(option))):
+        app_instance.delete_invitee_data(["a@example.com", "b@example.com"], **option)
+
+def test_missing_required_parameters_are_rejected(app_instance):
+    with pytest.raises(ValueError, match="'invitee_uuid'"):
+        app_instance.get_event_invitee("e1", None)
+    with pytest.raises(ValueError, match="'uuid'"):
+        app_instance.get_event(uuid=None)
+
+
+def test_rate_limited_requests_are_retried(app_instance):
+    delays = []
+    retry_after = "2"
+    statuses = iter(
+        [httpx.codes.TOO_MANY_REQUESTS, httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.OK]
+    )
+
+    def handler(request):
+        status = next(statuses)
+        headers = (
+            {"Retry-After": retry_after}
+            if status == httpx.codes.TOO_MANY_REQUESTS
+            else {}
+        )
+        return httpx.Response(status, headers=headers, json={"resource": {}})
+
+    transport = app_module._RetryTransport(
+        httpx.MockTransport(handler), app_instance._bucket, sleep=delays.append
+    )
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=transport
+    )
+    assert app_instance.get_group("g1") == {"resource": {}}
+    backoff = app_module.RETRY_BACKOFF * 2
+    assert delays[0] == float(retry_after)
+    assert backoff <= delays[1] <= backoff + app_module.RETRY_JITTER
+
+
+def test_token_bucket_throttles_bursts_and_backs_off_on_429():
+    bucket = app_module._TokenBucket(rate=2.0, capacity=2, clock=lambda: 100.0)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    bucket.record(httpx.codes.TOO_MANY_REQUESTS)
+    assert bucket.rate == bucket.max_rate / 2
+    bucket.record(httpx.codes.OK)
+    assert bucket.rate == bucket.max_rate / 2 + bucket.max_rate / 10
+
+def test_rate_limit_is_configurable(app_instance):
+    app = CalendlyApp(
+        integration=app_instance.integration, rate_limit=10, rate_limit_burst=5
+    )
+    assert (app._bucket.max_rate, app._bucket.capacity) == (10, 5)
+
+def test_failed_posts_are_not_retried(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(httpx.codes.SERVICE_UNAVAILABLE)
+
+    transport = app_module._RetryTransport(
+        httpx.MockTransport(handler), app_instance._bucket
+    )
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=transport
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        app_instance.create_invitee_no_show(
+            invitee="https://api.calendly.com/invitees/i1"
+        )
+    assert calls == ["POST"]
+
+def test_expired_lookups_are_revalidated_with_etag(app_instance):
+    seen = []
+    now = [0.0]
+    app_instance._cache = app_module._ResponseCache(
+        app_module.CACHE_SIZE, clock=lambda: now[0]
+    )
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(httpx.codes.NOT_MODIFIED, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            httpx.codes.OK,
+            headers={"ETag": '"v1"'},
+            json={"resource": {"name": "30 min"}},
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    assert app_instance.get_event_type("t1") == {"resource": {"name": "30 min"}}
+    now[0] += app_module.LOOKUP_REVALIDATE_AFTER + 1
+    assert app_instance.get_event_type("t1") == {"resource": {"name": "30 min"}}
+    assert seen == [None, '"v1"']
+
+def test_uncached_events_are_still_revalidated_with_etag(app_instance):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"e1"':
+            return httpx.Response(httpx.codes.NOT_MODIFIED, headers={"ETag": '"e1"'})
+        return httpx.Response(
+            httpx.codes.OK,
+            headers={"ETag": '"e1"'},
+            json={"resource": {"status": "active"}},
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    assert (
+        app_instance.get_event("e1")
+        == app_instance.get_event("e1")
+        == {"resource": {"status": "active"}}
+    )
+    assert seen == [None, '"e1"']
+
+def test_lookups_without_etag_are_revalidated_by_date(app_instance):
+    seen = []
+    stamp = "Wed, 14 Oct 2026 08:00:00 GMT"
+
+    def handler(request):
+        seen.append(request.headers.get("If-Modified-Since"))
+        if request.headers.get("If-Modified-Since") == stamp:
+            return httpx.Response(httpx.codes.NOT_MODIFIED)
+        return httpx.Response(
+            httpx.codes.OK,
+            headers={"Last-Modified": stamp},
+            json={"resource": {"status": "active"}},
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    assert (
+        app_instance.get_event("e1")
+        == app_instance.get_event("e1")
+        == {"resource": {"status": "active"}}
+    )
+    assert seen == [None, stamp]
+
+def test_posts_reuse_client_headers(app_instance):
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer dummy_access_token"
+        return httpx.Response(httpx.codes.CREATED, json={"resource": {}})
+
+    app_instance._client = None
+    app_instance.client._transport = httpx.MockTransport(handler)
+    app_instance.create_invitee_no_show(invitee="https://api.calendly.com/invitees/i1")
+    app_instance.create_invitee_no_show(invitee="https://api.calendly.com/invitees/i2")
+    assert app_instance.integration.get_credentials.call_count == 1
+
+def test_aiter_event_invitees_follows_page_tokens(app_instance):
+    pages = {
+        None: {"collection": [{"id": 1}], "pagination": {"next_page_token": "p2"}},
+        "p2": {"collection": [{"id": 2}], "pagination": {}},
+    }
+
+    def handler(request):
+        assert request.url.path == "/scheduled_events/e1/invitees"
+        return httpx.Response(
+            httpx.codes.OK, json=pages[request.url.params.get("page_token")]
+        )
+
+    async def collect():
+        app_instance._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return [
+            invitee["id"] async for invitee in app_instance.aiter_event_invitees("e1")
+        ]
+
+    assert asyncio.run(collect()) == [1, 2]
+
+def test_invitees_of_many_events_are_collected_concurrently(app_instance):
+    def handler(request):
+        event = request.url.path.split("/")[2]
+        assert request.url.params["status"] == "active"
+        if request.url.params.get("page_token"):
+            return httpx.Response(
+                httpx.codes.OK, json={"collection": [f"{event}-2"], "pagination": {}}
+            )
+        return httpx.Response(
+            httpx.codes.OK,
+            json={
+                "collection": [f"{event}-1"],
+                "pagination": {"next_page_token": "p2"},
+            },
+        )
+
+    app_instance._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    assert app_instance.list_event_invitees_many(["e1", "e2"], status="active") == [
+        ["e1-1", "e1-2"],
+        ["e2-1", "e2-2"],
+    ]
+    with pytest.raises(ValueError):
+        app_instance.list_event_invitees_many(["../x"])
+
+def test_get_many_collects_failures_when_asked(app_instance):
+    def handler(request):
+        if request.url.path == "/groups/missing":
+            return httpx.Response(
+                httpx.codes.NOT_FOUND, json={"title": "Resource Not Found"}
+            )
+        return httpx.Response(
+            httpx.codes.OK, json={"resource": {"uri": request.url.path}}
+        )
+
+    app_instance._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    first, missing = app_instance.get_many(
+        "get_group", ["g1", "missing"], return_exceptions=True
+    )
+    assert first == {"resource": {"uri": "/groups/g1"}}
+    assert isinstance(missing, httpx.HTTPStatusError)
+    with pytest.raises(ValueError):
+        app_instance.get_many("list_groups", ["g1"])
+    with pytest.raises(ValueError, match="takes 1"):
+        app_instance.get_many("get_event", [("a", "b")])
+    with pytest.raises(ValueError, match="takes 2"):
+        app_instance.get_many("get_event_invitee", ["a"])
+
+def test_run_batch_runs_mixed_tool_calls_in_order(app_instance):
+    def handler(request):
+        if request.url.path == "/groups/missing":
+            return httpx.Response(httpx.codes.NOT_FOUND)
+        return httpx.Response(
+            httpx.codes.OK,
+            json={"path": request.url.path, "params": dict(request.url.params)},
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    calls = [
+        ("get_group", {"uuid": "g1"}),
+        ("list_user_busy_times", {"user": "u1"}),
+        ("get_group", {"uuid": "missing"}),
+    ]
+    first, second, missing = app_instance.run_batch(calls, return_exceptions=True)
+    assert first == {"path": "/groups/g1", "params": {}}
+    assert second == {"path": "/user_busy_times", "params": {"user": "u1"}}
+    assert isinstance(missing, httpx.HTTPStatusError)
+    assert asyncio.run(app_instance.arun_batch(calls[:1])) == [first]
+    with pytest.raises(ValueError):
+        app_instance.run_batch([("_get", {"url": "/"})])
+
+def test_delete_many_fans_out_and_drops_cached_entries(app_instance):
+    deleted = []
+
+    def handler(request):
+        if request.method == "DELETE":
+            deleted.append(request.url.path)
+            return httpx.Response(httpx.codes.NO_CONTENT)
+        return httpx.Response(
+            httpx.codes.OK, json={"resource": {"uri": request.url.path}}
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance._async_client = httpx.AsyncClient(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.get_webhook_subscription("w1")
+    assert app_instance.delete_webhook_subscriptions_many(["w1", "w2"]) == [None, None]
+    assert sorted(deleted) == ["/webhook_subscriptions/w1", "/webhook_subscriptions/w2"]
+    assert app_instance.cache_stats()["size"] == 0
+    with pytest.raises(ValueError):
+        app_instance.delete_many("delete_invitee_data", ["x"])
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_batch_concurrency_must_be_positive(app_instance, concurrency):
+    with pytest.raises(ValueError, match="concurrency"):
+        app_instance.get_many("get_group", ["g1"], concurrency=concurrency)
+    with pytest.raises(ValueError, match="concurrency"):
+        app_instance.delete_many(
+            "delete_webhook_subscription", ["w1"], concurrency=concurrency
+        )
+    with pytest.raises(ValueError, match="concurrency"):
+        app_instance.run_batch([("get_group", {"uuid": "g1"})], concurrency=concurrency)
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(
+            app_instance.arun_batch(
+                [("get_group", {"uuid": "g1"})], concurrency=concurrency
+            )
+        )
+    with pytest.raises(ValueError, match="concurrency"):
+        app_instance.list_event_invitees_many(["e1"], concurrency=concurrency)
+
+def test_list_cache_is_keyed_by_query_params(app_instance):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["organization"])
+        return httpx.Response(httpx.codes.OK, json={"collection": []})
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.list_groups(organization="o1", count="10")
+    app_instance.list_groups(count="10", organization="o1")
+    app_instance.list_groups(organization="o2")
+    assert calls == ["o1", "o2"]
+
+def test_request_bodies_are_sent_as_json(app_instance):
+    availability_rule = {
+        "timezone": "UTC",
+        "rules": [
+            {
+                "type": "wday",
+                "wday": "monday",
+                "intervals": [{"from": "09:00", "to": "17:00"}],
+            }
+        ],
+    }
+
+    def handler(request):
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "event_type": "https://api.calendly.com/event_types/t1",
+            "availability_rule": availability_rule,
+        }
+        return httpx.Response(httpx.codes.CREATED, json={"resource": {}})
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    app_instance.create_share(
+        event_type="https://api.calendly.com/event_types/t1",
+        availability_rule=availability_rule,
+    )
+
+
+def test_iter_pages_walks_any_paginated_endpoint(app_instance):
+    def handler(request):
+        assert request.url.path == "/organizations/o1/invitations"
+        return httpx.Response(
+            httpx.codes.OK,
+            json={"collection": [{"email": "a@example.com"}], "pagination": {}},
+        )
+
+    app_instance._client = httpx.Client(
+        base_url=app_instance.base_url, transport=httpx.MockTransport(handler)
+    )
+    assert list(
+        app_instance.iter_pages("list_organization_invitations", uuid="o1")
+    ) == [{"email": "a@example.com"}]
+    with pytest.raises(ValueError, match="'uuid'"):
+        app_instance.iter_pages("list_organization_invitations")
+    with pytest.raises(ValueError):
+        app_instance.iter_pages("get_user")
+
+def test_iter_pages_rejects_unknown_filters(app_instance):
+    with pytest.raises(ValueError, match="stauts"):
+        app_instance.iter_events(stauts="active")
+
+def test_tool_map_matches_list_tools(app_instance):
+    assert list(app_instance.tool_map) == [
+        tool.__name__ for tool in app_instance.list_tools()
+    ]
+    assert app_instance.tool_map is app_instance.tool_map
+    first, second = app_instance.list_tools(), app_instance.list_tools()
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+
+def test_tool_schemas_are_built_once(app_instance):
+    schemas = app_instance.tool_schemas
+    assert schemas is app_instance.tool_schemas
+    assert list(schemas) == [tool.__name__ for tool in app_instance.list_tools()]
+    assert app_instance.get_tool_schema("get_event").parameters["required"] == ["uuid"]
+
+def test_client_accepts_compressed_responses(app_instance):
+    assert "gzip" in app_instance.client.headers["Accept-Encoding"]
+
+def test_malformed_identifiers_fail_before_any_request(app_instance):
+    app_instance._client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: pytest.fail("request sent"))
+    )
+    with pytest.raises(ValueError, match="Invalid value for parameter 'uuid'"):
+        app_instance.get_user("https://api.calendly.com/users/ABCDEF")
+    with pytest.raises(ValueError, match="Invalid value"):
+        app_instance.iter_pages("list_event_invitees", uuid="../users/me")